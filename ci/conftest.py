@@ -0,0 +1,102 @@
+# Copyright 2025, SERTIT-ICube - France, https://sertit.unistra.fr/
+# This file is part of sertit-utils project
+#     https://github.com/sertit/sertit-utils
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Pytest fixtures shared by all the tests"""
+
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def kml_driver():
+    """Set the KML driver once for the whole session (an error will occur if this fails)"""
+    from sertit import vectors
+
+    vectors.set_kml_driver()
+    yield
+
+
+@pytest.fixture
+def mocked_s3():
+    """
+    Mock S3 with moto (without any network access) and set the default S3 client on it.
+    Yields the root of an empty mocked bucket.
+    GDAL's /vsis3/ requests are not intercepted by moto: only read the files with cloudpathlib or boto3.
+    """
+    moto = pytest.importorskip("moto", minversion="5.0")
+    import boto3
+    from tempenv import tempenv
+
+    from sertit import AnyPath
+    from sertit.s3 import AWS_S3_ENDPOINT, temp_s3
+
+    bucket = "sertit-sertit-utils-ci"
+    with (
+        tempenv.TemporaryEnvironment(
+            {
+                "AWS_ACCESS_KEY_ID": "testing",
+                "AWS_SECRET_ACCESS_KEY": "testing",
+                "AWS_DEFAULT_REGION": "us-east-1",
+                "AWS_PROFILE": None,
+                "AWS_S3_PROFILE": None,
+                "AWS_ENDPOINT_URL": None,
+                AWS_S3_ENDPOINT: None,
+            }
+        ),
+        moto.mock_aws(),
+        temp_s3(),
+    ):
+        boto3.client("s3").create_bucket(Bucket=bucket)
+        yield AnyPath(f"s3://{bucket}")
+
+
+@pytest.fixture
+def core_dir(tmp_path):
+    """
+    Create a small directory tree in the temporary directory of the test (core/file.txt and core/sub/sub_file.txt).
+    Yields the path of the root directory (core).
+    """
+    root_dir = tmp_path / "core"
+    root_dir.joinpath("sub").mkdir(parents=True)
+    root_dir.joinpath("file.txt").write_text("file")
+    root_dir.joinpath("sub", "sub_file.txt").write_text("sub_file")
+    yield root_dir
+
+
+@pytest.fixture
+def write_geotiff():
+    """
+    Yields a function writing a (bands, rows, cols) array as a GeoTIFF (10 m pixels in EPSG:32631) and returning its path.
+    Other keyword arguments (i.e. tiling or compression options) are passed to :code:`rasterio.open`.
+    """
+    import rasterio
+    from affine import Affine
+
+    def write(raster_path, arr, **kwargs):
+        with rasterio.open(
+            raster_path,
+            "w",
+            driver="GTiff",
+            width=arr.shape[2],
+            height=arr.shape[1],
+            count=arr.shape[0],
+            dtype=arr.dtype,
+            crs="EPSG:32631",
+            transform=Affine(10.0, 0.0, 0.0, 0.0, -10.0, 0.0),
+            **kwargs,
+        ) as dst:
+            dst.write(arr)
+        return raster_path
+
+    yield write
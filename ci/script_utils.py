@@ -16,7 +16,7 @@
 import os
 import sys
 from enum import unique
-from functools import wraps
+from functools import cache, lru_cache, wraps
 
 from sertit import AnyPath, dask, unistra
 from sertit.misc import ListEnum
@@ -25,6 +25,8 @@ CI_SERTIT_S3 = "CI_SERTIT_USE_S3"
 
 KAPUT_KWARGS = {"fdezf": 0}
 
+CI_OUTPUT_PATH = AnyPath(__file__).resolve().parent / "ci_output"
+
 
 @unique
 class Polarization(ListEnum):
@@ -42,12 +44,19 @@ def get_s3_ci_path():
     return AnyPath("s3://sertit-sertit-utils-ci")
 
 
+@cache
+def get_db3_ci_data_path():
+    """Get CI DATA path on the mounted DS2 drive (cached as it cannot change during a run)"""
+    return AnyPath(unistra.get_db3_path()) / "CI" / "sertit_utils" / "DATA"
+
+
 def get_ci_data_path():
     """Get CI DATA path"""
     if int(os.getenv(CI_SERTIT_S3, 1)) and sys.platform != "win32":
+        # Not cached: the S3 client needs to be (re)defined as the tests may change it
         return get_s3_ci_path() / "DATA"
     else:
-        return AnyPath(unistra.get_db3_path()) / "CI" / "sertit_utils" / "DATA"
+        return get_db3_ci_data_path()
 
 
 def dask_env(function):
@@ -78,6 +87,22 @@ def dask_env(function):
     return dask_env_wrapper
 
 
+@lru_cache(maxsize=32)
+def _read_vector(vector_path):
+    from sertit import vectors
+
+    return vectors.read(vector_path)
+
+
+def read_vector(vector_path):
+    """
+    Read a CI vector, caching it as the CI data doesn't change during a run.
+
+    A copy is returned so that a test modifying the vector doesn't alter the cache.
+    """
+    return _read_vector(AnyPath(vector_path)).copy()
+
+
 def rasters_path():
     return get_ci_data_path().joinpath("rasters")
 
@@ -108,8 +133,7 @@ def s3_env(*args, **kwargs):
 
 def get_output(tmp, file, debug=False):
     if debug:
-        out_path = AnyPath(__file__).resolve().parent / "ci_output"
-        out_path.mkdir(parents=True, exist_ok=True)
-        return out_path / file
+        CI_OUTPUT_PATH.mkdir(parents=True, exist_ok=True)
+        return CI_OUTPUT_PATH / file
     else:
         return AnyPath(tmp, file)
@@ -15,6 +15,7 @@
 # limitations under the License.
 """Script testing the CI"""
 
+import hashlib
 import os
 import tempfile
 
@@ -22,7 +23,7 @@ import pytest
 from lxml import etree
 
 from ci.script_utils import files_path, rasters_path, s3_env, vectors_path
-from sertit import ci, path, rasters, rasters_rio, vectors
+from sertit import AnyPath, ci, path, rasters, rasters_rio, vectors
 
 ci.reduce_verbosity()
 
@@ -77,6 +78,57 @@ def test_assert_files():
     with pytest.raises(AssertionError):
         ci.assert_files_equal(ok_path, false_path)
 
+    # Local copy vs original (hashed if the original is stored on the cloud)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        local_path = AnyPath(tmp_dir, ok_path.name)
+        local_path.write_bytes(ok_path.read_bytes())
+        ci.assert_files_equal(local_path, ok_path)
+        ci.assert_files_equal(ok_path, local_path)
+
+        local_false_path = AnyPath(tmp_dir, false_path.name)
+        local_false_path.write_bytes(false_path.read_bytes())
+        with pytest.raises(AssertionError):
+            ci.assert_files_equal(local_false_path, ok_path)
+
+
+def test_assert_files_local(tmp_path):
+    """Test assert_files_equal on local files"""
+    file_1 = tmp_path / "file_1.txt"
+    file_2 = tmp_path / "file_2.txt"
+    file_1.write_bytes(b"a\nb\n")
+
+    # Same content
+    file_2.write_bytes(b"a\nb\n")
+    ci.assert_files_equal(file_1, file_2)
+
+    # Different sizes
+    file_2.write_bytes(b"a\nb\nc\n")
+    with pytest.raises(AssertionError, match="Non equal file sizes"):
+        ci.assert_files_equal(file_1, file_2)
+
+    # Same size, different content
+    file_2.write_bytes(b"a\nc\n")
+    with pytest.raises(AssertionError):
+        ci.assert_files_equal(file_1, file_2)
+
+    # Line endings matter
+    file_2.write_bytes(b"a\r\nb\r\n")
+    with pytest.raises(AssertionError):
+        ci.assert_files_equal(file_1, file_2)
+
+    # Empty files
+    empty_1 = tmp_path / "empty_1.txt"
+    empty_2 = tmp_path / "empty_2.txt"
+    empty_1.touch()
+    empty_2.touch()
+    ci.assert_files_equal(empty_1, empty_2)
+    with pytest.raises(AssertionError):
+        ci.assert_files_equal(empty_1, file_1)
+
+    # Hashes (memory-mapped files)
+    ci.assert_val(ci._hash_file(empty_1), hashlib.sha256().hexdigest(), "hash")
+    ci.assert_val(ci._hash_file(file_1), hashlib.sha256(b"a\nb\n").hexdigest(), "hash")
+
 
 @s3_env
 def test_assert_vect():
@@ -99,6 +151,37 @@ def test_assert_vect():
         ci.assert_geom_almost_equal(vector_path, vec2_df)
 
 
+def test_assert_raster_blocks(tmp_path, write_geotiff):
+    """Test assert_raster_equal on rasters with the same content stored differently"""
+    import numpy as np
+
+    for dtype in [np.uint8, np.float32]:
+        arr = np.arange(2 * 100 * 100).reshape((2, 100, 100)).astype(dtype)
+        if dtype == np.float32:
+            arr[:, 10:20, 10:20] = np.nan
+
+        # Same array, different compression and tiling: not byte-identical
+        striped = write_geotiff(tmp_path / f"striped_{dtype.__name__}.tif", arr)
+        tiled = write_geotiff(
+            tmp_path / f"tiled_{dtype.__name__}.tif",
+            arr,
+            tiled=True,
+            blockxsize=32,
+            blockysize=32,
+            compress="deflate",
+        )
+        ci.assert_raster_equal(striped, tiled)
+        ci.assert_raster_equal(tiled, striped)
+
+        # One pixel changed
+        arr[1, 99, 99] += 1
+        changed = write_geotiff(tmp_path / f"changed_{dtype.__name__}.tif", arr)
+        with pytest.raises(AssertionError):
+            ci.assert_raster_equal(striped, changed)
+        with pytest.raises(AssertionError):
+            ci.assert_raster_equal(tiled, changed)
+
+
 @s3_env
 def test_assert_raster():
     # Rasters
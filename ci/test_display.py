@@ -16,12 +16,16 @@
 """Script testing SNAP functions"""
 
 import numpy as np
+import pytest
 
 from ci.script_utils import dask_env, display_path, s3_env
 from sertit import ci, display, rasters_rio
 
 ci.reduce_verbosity()
 
+# Keep the tests creating dask clusters on the same pytest-xdist worker
+pytestmark = pytest.mark.xdist_group("dask")
+
 
 @s3_env
 @dask_env
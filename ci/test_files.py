@@ -18,6 +18,9 @@
 import os
 import shutil
 import tempfile
+import threading
+import warnings
+import zipfile
 from datetime import date, datetime
 
 import numpy as np
@@ -90,6 +93,90 @@ def test_archive():
         ci.assert_dir_equal(unzip_dirs[0], unzip_dirs[1])
 
 
+def test_extract_s3_tar(tmp_path, mocked_s3, core_dir):
+    """Test extracting tar archives streamed from S3"""
+    for fmt in ["tar", "gztar"]:
+        # Archive containing its root directory
+        archive_fn = files.archive(core_dir, tmp_path / "core", fmt=fmt)
+        s3_archive = mocked_s3 / archive_fn.name
+        s3_archive.upload_from(archive_fn)
+
+        out = files.extract_file(s3_archive, tmp_path / f"out_{fmt}", overwrite=True)
+        assert out == tmp_path / f"out_{fmt}" / "core"
+        ci.assert_dir_equal(core_dir, out)
+
+        # Overwrite an existing extraction
+        out = files.extract_file(s3_archive, tmp_path / f"out_{fmt}", overwrite=True)
+        ci.assert_dir_equal(core_dir, out)
+
+        # No temporary directory left behind
+        assert os.listdir(tmp_path / f"out_{fmt}") == ["core"]
+
+        # Archive without root directory
+        s3_archive = mocked_s3 / archive_fn.name.replace("core", "no_root")
+        s3_archive.upload_from(
+            shutil.make_archive(
+                str(tmp_path / "no_root"), format=fmt, root_dir=core_dir
+            )
+        )
+        out = files.extract_file(s3_archive, tmp_path / f"out_{fmt}")
+        assert out == tmp_path / f"out_{fmt}" / "no_root"
+        ci.assert_dir_equal(core_dir, out)
+
+
+def test_add_zip_to_zip(tmp_path, core_dir):
+    """Test adding zip files (copied entry by entry) to another zip"""
+
+    # With (core.zip) or without (other.zip) a root directory named after the archive
+    base_dir = tmp_path / "base"
+    base_dir.mkdir()
+    base_dir.joinpath("base.txt").write_text("base")
+    zip_path = files.archive(base_dir, tmp_path / "archive", fmt="zip")
+    zip_to_add = [
+        files.archive(core_dir, tmp_path / "to_add" / "core", fmt="zip"),
+        files.archive(core_dir, tmp_path / "to_add" / "other", fmt="zip"),
+    ]
+    files.add_to_zip(zip_path, zip_to_add)
+
+    out = files.extract_file(zip_path, tmp_path / "out")
+    ci.assert_dir_equal(base_dir, out / "base")
+    ci.assert_dir_equal(core_dir, out / "core")
+    ci.assert_dir_equal(core_dir, out / "other" / "core")
+
+    # Small members are written without ZIP64 extra field in their local header
+    with zipfile.ZipFile(zip_path) as zip_ds, open(zip_path, "rb") as zip_raw:
+        for member in zip_ds.infolist():
+            zip_raw.seek(member.header_offset + 28)
+            assert int.from_bytes(zip_raw.read(2), "little") == 0, member.filename
+
+
+def test_extract_zip_parallel(tmp_path, monkeypatch, core_dir):
+    """Test the parallel extraction of zip files, with parent directories created concurrently"""
+    zip_path = files.archive(core_dir, tmp_path / "core", fmt="zip")
+
+    # Force the parallel extraction, even for small members and on a single CPU
+    monkeypatch.setattr(files, "ZIP_PARALLEL_MIN_SIZE", 0)
+    monkeypatch.setattr(os, "cpu_count", lambda: 4)
+
+    # Simulate another thread creating the parent directory concurrently
+    makedirs = os.makedirs
+    races = []
+
+    def racing_makedirs(name, *args, **kwargs):
+        makedirs(name, *args, **kwargs)
+        if not races and threading.current_thread() is not threading.main_thread():
+            races.append(name)
+            raise FileExistsError(name)
+
+    monkeypatch.setattr(os, "makedirs", racing_makedirs)
+
+    out = files.extract_file(zip_path, tmp_path / "out")
+    monkeypatch.undo()
+
+    assert races
+    ci.assert_dir_equal(core_dir, out)
+
+
 @s3_env
 def test_archived_files():
     landsat_name = "LM05_L1TP_200030_20121230_20200820_02_T2_CI"
@@ -197,6 +284,11 @@ def test_cp_rm():
         assert os.path.isfile(file_1)
         assert os.path.isfile(file_2)
         assert os.path.isdir(test_dir)
+        ci.assert_files_equal(curr_path, file_1)
+        ci.assert_files_equal(curr_path, file_2)
+        ci.assert_files_equal(
+            curr_path, os.path.join(test_dir, os.path.basename(curr_path))
+        )
 
         # Remove file
         files.remove(file_1)
@@ -209,6 +301,56 @@ def test_cp_rm():
         # Assert tempfile is empty
         assert os.listdir(tmp_dir) == empty_tmp
 
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_dir = AnyPath(tmp_dir)
+        pattern_dir = tmp_dir / "pattern_dir"
+        pattern_dir.joinpath("sub").mkdir(parents=True)
+        pattern_dir.joinpath("sub", "file.txt").write_text("file")
+        tmp_dir.joinpath("pattern.txt").write_text("txt")
+        tmp_dir.joinpath("pattern.py").write_text("py")
+        tmp_dir.joinpath("other.txt").write_text("other")
+
+        # Remove by pattern with an extension
+        files.remove_by_pattern(tmp_dir, name_with_wildcard="pattern*", extension="txt")
+        assert sorted(os.listdir(tmp_dir)) == ["other.txt", "pattern.py", "pattern_dir"]
+
+        # Remove by pattern without extension (directories included)
+        files.remove_by_pattern(tmp_dir, name_with_wildcard="pattern*")
+        assert os.listdir(tmp_dir) == ["other.txt"]
+
+        # Symlinks are followed: links to files are removed, links to directories and broken links are kept
+        target_dir = tmp_dir / "target_dir"
+        target_dir.mkdir()
+        tmp_dir.joinpath("link_file.txt").symlink_to(tmp_dir / "other.txt")
+        tmp_dir.joinpath("link_dir").symlink_to(target_dir, target_is_directory=True)
+        tmp_dir.joinpath("link_broken").symlink_to(tmp_dir / "non_existing.txt")
+        files.remove_by_pattern(tmp_dir, name_with_wildcard="link*")
+        assert sorted(os.listdir(tmp_dir)) == [
+            "link_broken",
+            "link_dir",
+            "other.txt",
+            "target_dir",
+        ]
+
+
+def test_copy_fallback(tmp_path, monkeypatch):
+    """Test the copy of files falls back to shutil when copy_file_range doesn't copy anything"""
+    src = tmp_path / "src.bin"
+    src.write_bytes(os.urandom(100000))
+
+    # Some filesystems silently copy nothing
+    if hasattr(os, "copy_file_range"):
+        monkeypatch.setattr(os, "copy_file_range", lambda *args, **kwargs: 0)
+    dst = files.copy(src, tmp_path / "dst.bin")
+    assert dst.read_bytes() == src.read_bytes()
+    monkeypatch.undo()
+
+    # Files with a size of 0 but some content
+    proc_file = AnyPath("/proc/self/status")
+    if proc_file.is_file():
+        dst = files.copy(proc_file, tmp_path / "status.txt")
+        assert dst.stat().st_size > 0
+
 
 def test_json():
     """Test json functions"""
@@ -222,6 +364,10 @@ def test_json():
         "F": Polarization.vv,
         "G": True,
         "H": AnyPath("/home/data"),
+        "I": np.float32(1.5),
+        "J": np.uint8(3),
+        "K": np.bool_(False),
+        "L": np.array([[1, 2], [3, 4]], dtype=np.int16),
     }
 
     with tempfile.TemporaryDirectory() as tmp_dir:
@@ -240,6 +386,9 @@ def test_json():
         assert obj.pop("H") == str(
             test_dict.pop("H")
         )  # Enum are stored following their value
+
+        # Numpy arrays are stored as lists
+        assert obj.pop("L") == test_dict.pop("L").tolist()
         assert obj == test_dict
 
         # Test deprecation
@@ -270,6 +419,61 @@ def test_pickle():
         # Test (couldn't compare the dicts as they contain numpy arrays)
         np.testing.assert_equal(obj, test_dict)
 
+        # Save pickle with the standard pickle module
+        files.save_obj(test_dict, pkl_file, use_dill=False)
+        np.testing.assert_equal(files.load_obj(pkl_file), test_dict)
+
+
+def test_hash_file(tmp_path):
+    """Test hash_file"""
+    # Bigger than the buffer, and not a multiple of its size
+    file_content = os.urandom(files.HASH_BUFFER_SIZE * 2 + 10)
+    big_file = tmp_path / "big_file.bin"
+    big_file.write_bytes(file_content)
+    ci.assert_val(
+        files.hash_file(big_file), files.hash_file_content(file_content), "hash"
+    )
+
+    empty_file = tmp_path / "empty_file.bin"
+    empty_file.touch()
+    ci.assert_val(
+        files.hash_file(empty_file, len_param=10),
+        files.hash_file_content(b"", len_param=10),
+        "hash",
+    )
+
+
+def test_moved_to_path_warning(monkeypatch):
+    """Test the deprecation warning of the functions moved to sertit.path is raised once per call site"""
+    monkeypatch.setattr(files, "_WARNED_MOVED_TO_PATH", set())
+
+    def get_ext_in_loop():
+        # Only one warning for the same call site
+        with warnings.catch_warnings(record=True) as warns:
+            warnings.simplefilter("always")
+            for _ in range(3):
+                files.get_ext("dir/file.txt")
+        return warns
+
+    warns = get_ext_in_loop()
+    assert len(warns) == 1
+    assert warns[0].category is DeprecationWarning
+    assert warns[0].filename == __file__
+
+    # Silenced once this call site has warned
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", DeprecationWarning)
+        get_ext_in_loop()
+
+    # Other call sites still warn, even if the warning has been filtered out elsewhere
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        files.get_filename("dir/file.txt")
+    with pytest.deprecated_call():
+        files.get_ext("dir/file.txt")
+    with pytest.deprecated_call():
+        files.get_filename("dir/file.txt")
+
 
 def test_hash_file_content():
     """Test hash_file_content"""
@@ -279,4 +483,16 @@ def test_hash_file_content():
     hashed = files.hash_file_content(file_content)
 
     # Test
-    assert hashed == "16c5bf1fc5"
+    assert hashed == "1fe5bd5c00"
+    assert files.hash_file_content(file_content.encode()) == hashed
+    assert len(files.hash_file_content(file_content, len_param=10)) == 20
+
+    # Several contents at once (small and big ones, hashed in parallel)
+    file_contents = [file_content, "This is another test."]
+    assert files.hash_file_contents(file_contents) == [
+        files.hash_file_content(content) for content in file_contents
+    ]
+    file_contents = [file_content * 100000, b"0" * 1000000]
+    assert files.hash_file_contents(file_contents, len_param=10) == [
+        files.hash_file_content(content, len_param=10) for content in file_contents
+    ]
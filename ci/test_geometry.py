@@ -15,8 +15,14 @@
 # limitations under the License.
 """Script testing vector functions"""
 
-from ci.script_utils import KAPUT_KWARGS, geometry_path, s3_env, vectors_path
-from sertit import ci, geometry, vectors
+from ci.script_utils import (
+    KAPUT_KWARGS,
+    geometry_path,
+    read_vector,
+    s3_env,
+    vectors_path,
+)
+from sertit import ci, geometry
 from sertit.geometry import (
     buffer,
     fill_polygon_holes,
@@ -36,8 +42,8 @@ def test_get_wider_exterior():
     footprint_raw_path = geometry_path().joinpath("footprint_raw.geojson")
     footprint_path = geometry_path().joinpath("footprint.geojson")
     ci.assert_geom_equal(
-        get_wider_exterior(vectors.read(footprint_raw_path)),
-        vectors.read(footprint_path),
+        get_wider_exterior(read_vector(footprint_raw_path)),
+        read_vector(footprint_path),
     )
 
 
@@ -48,15 +54,17 @@ def test_simplify_footprint():
         "complicated_footprint_spot6.geojson"
     )
     max_nof_vertices = 40
-    complicated_footprint = vectors.read(complicated_footprint_path)
+    complicated_footprint = read_vector(complicated_footprint_path)
     ok_footprint = geometry.simplify_footprint(
         complicated_footprint, resolution=1.5, max_nof_vertices=max_nof_vertices
     )
     assert len(ok_footprint.geometry.exterior.iat[0].coords) < max_nof_vertices
 
     # Just to test
-    nof_vertices_complicated = len(
-        complicated_footprint.explode(index_parts=True).geometry.exterior.iat[0].coords
+    nof_vertices_complicated = max(
+        len(poly.exterior.coords)
+        for geom in complicated_footprint.geometry
+        for poly in (geom.geoms if geom.geom_type.startswith("Multi") else [geom])
     )
     assert nof_vertices_complicated > max_nof_vertices
 
@@ -65,7 +73,7 @@ def test_simplify_footprint():
 def test_geometry_fct():
     """Test other geometry functions"""
     kml_path = vectors_path().joinpath("aoi.kml")
-    env = vectors.read(kml_path).envelope[0]
+    env = read_vector(kml_path).envelope[0]
     from_env = geometry.from_bounds_to_polygon(*geometry.from_polygon_to_bounds(env))
     assert env.bounds == from_env.bounds
 
@@ -74,7 +82,7 @@ def test_geometry_fct():
 def test_make_valid():
     """Test make valid"""
     broken_geom_path = geometry_path().joinpath("broken_geom.shp")
-    broken_geom = vectors.read(broken_geom_path)
+    broken_geom = read_vector(broken_geom_path)
     assert len(broken_geom[~broken_geom.is_valid]) == 1
     valid = geometry.make_valid(broken_geom, verbose=True)
     assert len(valid[~valid.is_valid]) == 0
@@ -88,12 +96,12 @@ def test_fill_polygon_holes():
     water_none_path = geometry_path().joinpath("water_filled_none.geojson")
     water_0_path = geometry_path().joinpath("water_filled_0.geojson")
     water_1000_path = geometry_path().joinpath("water_filled_1000.geojson")
-    water = vectors.read(water_path)
+    water = read_vector(water_path)
 
-    ci.assert_geom_equal(fill_polygon_holes(water), vectors.read(water_none_path))
-    ci.assert_geom_equal(fill_polygon_holes(water, 0), vectors.read(water_0_path))
+    ci.assert_geom_equal(fill_polygon_holes(water), read_vector(water_none_path))
+    ci.assert_geom_equal(fill_polygon_holes(water, 0), read_vector(water_0_path))
     ci.assert_geom_equal(
-        fill_polygon_holes(water, threshold=1000), vectors.read(water_1000_path)
+        fill_polygon_holes(water, threshold=1000), read_vector(water_1000_path)
     )
 
 
@@ -101,27 +109,27 @@ def test_fill_polygon_holes():
 def test_split():
     """Test split"""
     water_path = geometry_path().joinpath("water.geojson")
-    water = vectors.read(water_path)
+    water = read_vector(water_path)
 
     # No MultiLineStrings
     footprint_path = geometry_path().joinpath("footprint_split.geojson")
     water_split_path = geometry_path().joinpath("water_split.geojson")
     ci.assert_geom_equal(
-        split(water, vectors.read(footprint_path)), vectors.read(water_split_path)
+        split(water, read_vector(footprint_path)), read_vector(water_split_path)
     )
 
     # With MultiLineStrings
     footprint_raw_path = geometry_path().joinpath("footprint_raw.geojson")
     water_split_raw_path = geometry_path().joinpath("water_split_raw.geojson")
     ci.assert_geom_equal(
-        split(water, vectors.read(footprint_raw_path)),
-        vectors.read(water_split_raw_path),
+        split(water, read_vector(footprint_raw_path)),
+        read_vector(water_split_raw_path),
     )
 
     # Test with lines as splitter (with and without line_merge)
     # Without line_merge: doesn't split anything
     lines_raw_path = geometry_path().joinpath("lines.shp")
-    lines_raw = vectors.read(lines_raw_path)
+    lines_raw = read_vector(lines_raw_path)
     ci.assert_geom_equal(
         split(water, lines_raw),
         water,
@@ -132,7 +140,7 @@ def test_split():
     lines_merged = line_merge(lines_raw)
     ci.assert_geom_equal(
         split(water, lines_merged),
-        vectors.read(water_split_line_path),
+        read_vector(water_split_line_path),
     )
 
 
@@ -142,7 +150,7 @@ def test_intersects():
     water_path = geometry_path().joinpath("water.geojson")
     lakes_path = geometry_path().joinpath("lakes.geojson")
 
-    inter = intersects(vectors.read(lakes_path), vectors.read(water_path))
+    inter = intersects(read_vector(lakes_path), read_vector(water_path))
     ci.assert_val(inter.index, [2, 3], "Index")
 
 
@@ -150,7 +158,7 @@ def test_intersects():
 def test_buffer():
     """Test buffer"""
     water_path = geometry_path().joinpath("water.geojson")
-    water = vectors.read(water_path)
+    water = read_vector(water_path)
     buffer_true = water.copy()
     buffer_true.geometry = water.buffer(10)
 
@@ -163,8 +171,8 @@ def test_nearest_neighbors():
     src_path = geometry_path().joinpath("source.geojson")
     candidates_path = geometry_path().joinpath("candidates.geojson")
 
-    src = vectors.read(src_path)
-    candidates = vectors.read(candidates_path)
+    src = read_vector(src_path)
+    candidates = read_vector(candidates_path)
 
     # Radius
     radius = 100
@@ -196,7 +204,7 @@ def test_nearest_neighbors():
 
 def test_force_2_or_3d():
     """Force 2D or 3D"""
-    aoi_kml = vectors.read(vectors_path().joinpath("aoi.kml"))
+    aoi_kml = read_vector(vectors_path().joinpath("aoi.kml"))
 
     assert aoi_kml.has_z.any()
 
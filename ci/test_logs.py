@@ -29,7 +29,7 @@ from sertit.logs import LOGGING_FORMAT
 ci.reduce_verbosity()
 
 
-def test_log():
+def test_log(monkeypatch):
     """Testing log functions"""
 
     # -- INIT LOGGER --
@@ -83,6 +83,11 @@ def test_log():
                 )
 
         logs.reset_logging()
+
+        # Colors are only used in a terminal
+        monkeypatch.delenv("FORCE_COLOR", raising=False)
+        monkeypatch.delenv("NO_COLOR", raising=False)
+        monkeypatch.setattr(sys.stderr, "isatty", lambda: True)
         logs.create_logger(
             logger, stream_log_level=stream_log_lvl, other_loggers_names="test"
         )
@@ -119,6 +124,25 @@ def test_log():
         # Just in case
         sys.modules["colorlog"] = colorlog_sys
 
+        # Without terminal
+        monkeypatch.setattr(sys.stderr, "isatty", lambda: False)
+        logs.create_logger(logger, stream_log_level=stream_log_lvl)
+        for handler in logger.handlers:
+            assert not isinstance(handler.formatter, colored_fmt_cls)
+
+        # Forced colors without terminal
+        monkeypatch.setenv("FORCE_COLOR", "1")
+        logs.create_logger(logger, stream_log_level=stream_log_lvl)
+        for handler in logger.handlers:
+            assert isinstance(handler.formatter, colored_fmt_cls)
+
+        # No colors, even in a terminal (NO_COLOR takes precedence)
+        monkeypatch.setenv("NO_COLOR", "1")
+        monkeypatch.setattr(sys.stderr, "isatty", lambda: True)
+        logs.create_logger(logger, stream_log_level=stream_log_lvl)
+        for handler in logger.handlers:
+            assert not isinstance(handler.formatter, colored_fmt_cls)
+
         # Cleanup
         logs.shutdown_logger(logger)
         logs.shutdown_logger(logger_test)
@@ -133,3 +157,29 @@ def test_deprecation_warning():
     # Just test this doesn't throw an error
     with pytest.deprecated_call():
         logs.deprecation_warning("This is deprecated.")
+
+
+def test_reset_logging_shared_handler():
+    """Test reset_logging with a handler shared between loggers"""
+
+    class CountingHandler(logging.NullHandler):
+        nof_close = 0
+
+        def close(self):
+            self.nof_close += 1
+            super().close()
+
+    handler = CountingHandler()
+    loggers = [logging.getLogger(f"Test_shared_{i}") for i in range(3)]
+    for logger in loggers:
+        logger.addHandler(handler)
+
+    logs.reset_logging()
+
+    # The shared handler is closed only once and removed from every logger
+    assert handler.nof_close == 1
+    for logger in loggers:
+        assert logger.handlers == []
+
+    # Reduce verbosity again after resetting
+    ci.reduce_verbosity()
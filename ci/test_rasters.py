@@ -41,6 +41,9 @@ from sertit.vectors import EPSG_4326
 
 ci.reduce_verbosity()
 
+# Keep the tests creating dask clusters on the same pytest-xdist worker
+pytestmark = pytest.mark.xdist_group("dask")
+
 DEBUG = False
 
 
@@ -25,7 +25,7 @@ from cloudpathlib import AnyPath, S3Client
 from tempenv import tempenv
 
 from ci.script_utils import CI_SERTIT_S3
-from sertit import ci, rasters, vectors
+from sertit import ci, files, path, rasters, vectors
 from sertit.ci import AWS_S3_ENDPOINT
 from sertit.logs import SU_NAME
 from sertit.s3 import USE_S3_STORAGE, s3_env, temp_s3
@@ -53,6 +53,7 @@ def without_s3():
     return base_fct(None)
 
 
+@pytest.mark.integration
 def test_s3_raster():
     with tempenv.TemporaryEnvironment(
         {USE_S3_STORAGE: "1", AWS_S3_ENDPOINT: "s3.unistra.fr", CI_SERTIT_S3: "1"}
@@ -76,6 +77,7 @@ def test_s3_raster():
         assert with_s3(1, 2) == 1
 
 
+@pytest.mark.integration
 def test_s3_vector():
     # There is a mistake in endpoint but AWS_S3_ENDPOINT should override it
     with (
@@ -92,6 +94,35 @@ def test_s3_vector():
         assert vectors.read(vector_path).shape[0] == 1
 
 
+def test_s3_mocked(tmp_path, mocked_s3, write_geotiff):
+    """Test sertit's S3 helpers without any network access (S3 being mocked with moto)"""
+    import numpy as np
+
+    # Create a tiny raster on disk
+    local_path = write_geotiff(
+        tmp_path / "raster.tif", np.ones((1, 2, 2), dtype=np.uint8)
+    )
+
+    # The mocked_s3 fixture has set the default client: AnyPath creates S3 paths with it
+    raster_dir = AnyPath(str(mocked_s3)).joinpath("DATA", "rasters")
+    raster_path = raster_dir / "raster.tif"
+    raster_path.upload_from(local_path)
+
+    assert path.is_cloud_path(raster_path)
+    assert raster_path.is_file()
+    assert path.get_file_in_dir(raster_dir, "raster", extension="tif") == raster_path
+
+    # Mixed local/S3 comparison
+    ci.assert_files_equal(local_path, raster_path)
+
+    # Download the S3 file and read it
+    copied_path = files.copy(raster_path, tmp_path / "copied.tif")
+    assert not path.is_cloud_path(copied_path)
+    ci.assert_files_equal(copied_path, raster_path)
+    ci.assert_raster_equal(copied_path, local_path)
+
+
+@pytest.mark.integration
 def test_no_sign_request():
     with (
         tempenv.TemporaryEnvironment(
@@ -109,6 +140,7 @@ def test_no_sign_request():
             assert ds.meta["dtype"] == "uint16"
 
 
+@pytest.mark.integration
 def test_requester_pays():
     with (
         tempenv.TemporaryEnvironment(
@@ -58,6 +58,7 @@ def without_s3():
     base_fct(None)
 
 
+@pytest.mark.integration
 @s3_env
 def test_unistra_s3():
     with tempenv.TemporaryEnvironment(
@@ -49,10 +49,7 @@ def test_vectors():
     # with pytest.raises(AssertionError):
     #     ci.assert_geom_equal(shp_path, utm_path, ignore_z=False)
 
-    # KML
-    vectors.set_kml_driver()  # An error will occur afterwards if this fails (we are attempting to open a KML file)
-
-    # KML to WKT
+    # KML to WKT (the KML driver is set in the session fixture)
     aoi_str_test = vectors.get_aoi_wkt(kml_path, as_str=True)
     aoi_str = (
         "POLYGON Z ((46.1947755465253067 32.4973553439109324 0.0000000000000000, "
@@ -52,8 +52,12 @@ myst_enable_extensions = [
     "substitution",
 ]
 
+# Fast builds (SPHINX_FAST=1) for iterative edits:
+# don't execute the notebooks and don't regenerate the autosummary stubs
+sphinx_fast = bool(int(os.getenv("SPHINX_FAST", "0")))
+
 # Notebook integration parameters
-nb_execution_mode = "cache"
+nb_execution_mode = "off" if sphinx_fast else "cache"
 nb_execution_timeout = -1
 
 # Manage new READTHEDOCS output mechanism
@@ -65,12 +69,13 @@ if cache_path is not None:
 nbsphinx_prolog = ""
 
 # sphinx-copybutton configurations
+# (the prompt regex is written as a string into the pages and applied in the browser by JavaScript)
 copybutton_prompt_text = r">>> |\.\.\. |\$ |In \[\d*\]: | {2,5}\.\.\.: | {5,8}: "
 copybutton_prompt_is_regexp = True
 
 # Scan all found documents for autosummary directives, and to generate stub
 # pages for each
-autosummary_generate = True
+autosummary_generate = not sphinx_fast
 
 # Add any paths that contain templates here, relative to this directory.
 templates_path = ["_templates"]
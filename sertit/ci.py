@@ -18,8 +18,12 @@ CI tools
 """
 
 import filecmp
+import hashlib
 import logging
+import mmap
+import os
 import pprint
+from concurrent.futures import ThreadPoolExecutor
 from doctest import Example
 from typing import Any, Union
 
@@ -30,7 +34,7 @@ from lxml.doctestcompare import LHTMLOutputChecker, LXMLOutputChecker
 from shapely import force_2d, normalize
 from shapely.testing import assert_geometries_equal
 
-from sertit import AnyPath, files, s3, unistra
+from sertit import AnyPath, path, s3, unistra
 from sertit.logs import SU_NAME, deprecation_warning
 from sertit.types import AnyPathStrType, AnyXrDataStructure
 
@@ -41,6 +45,9 @@ AWS_ACCESS_KEY_ID = s3.AWS_ACCESS_KEY_ID
 AWS_SECRET_ACCESS_KEY = s3.AWS_SECRET_ACCESS_KEY
 AWS_S3_ENDPOINT = s3.AWS_S3_ENDPOINT
 
+HASH_CHUNK_SIZE = 1024 * 1024
+""" Size of the chunks read when hashing files (1 MiB) """
+
 
 def s3_env(*args, **kwargs):
     """
@@ -132,16 +139,94 @@ def assert_field(dict_1: dict, dict_2: dict, field: str) -> None:
     assert_val(dict_1[field], dict_2[field], field)
 
 
+def _hash_file(file_path: AnyPathStrType) -> str:
+    """
+    Hash the binary content of a file with SHA-256.
+
+    :code:`hashlib` relies on OpenSSL, which uses the SHA-NI instructions when the CPU provides them.
+    Local files are memory-mapped to be hashed without being copied in memory.
+
+    Args:
+        file_path (AnyPathStrType): Path to the file to hash
+
+    Returns:
+        str: Hex digest of the file content
+    """
+    file_path = AnyPath(file_path)
+    if path.is_cloud_path(file_path):
+        with file_path.open("rb") as file:
+            # Python >= 3.11: read into a reusable buffer
+            if hasattr(hashlib, "file_digest"):
+                return hashlib.file_digest(file, "sha256").hexdigest()
+
+            hasher = hashlib.sha256()
+            for chunk in iter(lambda: file.read(HASH_CHUNK_SIZE), b""):
+                hasher.update(chunk)
+            return hasher.hexdigest()
+
+    hasher = hashlib.sha256()
+    with open(file_path, "rb") as file:
+        # Empty files cannot be mapped
+        if os.fstat(file.fileno()).st_size > 0:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                # Trigger an aggressive readahead (not available on Windows)
+                if hasattr(mmap, "MADV_SEQUENTIAL"):
+                    mapped.madvise(mmap.MADV_SEQUENTIAL)
+                hasher.update(mapped)
+
+    return hasher.hexdigest()
+
+
+def _are_identical_local_files(path_1: AnyPathStrType, path_2: AnyPathStrType) -> bool:
+    """
+    Check if two paths point to byte-identical local files.
+
+    Args:
+        path_1 (AnyPathStrType): Path 1
+        path_2 (AnyPathStrType): Path 2
+
+    Returns:
+        bool: True if both paths are existing local files with the same content
+    """
+    path_1 = AnyPath(path_1)
+    path_2 = AnyPath(path_2)
+    return (
+        not path.is_cloud_path(path_1)
+        and not path.is_cloud_path(path_2)
+        and path_1.is_file()
+        and path_2.is_file()
+        and filecmp.cmp(path_1, path_2, shallow=False)
+    )
+
+
 def assert_files_equal(file_1: AnyPathStrType, file_2: AnyPathStrType):
     """
-    Assert to files are equal by hashing its content
+    Assert to files are equal by comparing their content
+
+    Local files are compared byte-to-byte (stopping at the first difference),
+    files stored on the cloud are compared by hashing their content.
 
     Args:
         file_1 (str): Path to file 1
         file_2 (str): Path to file 2
     """
-    with AnyPath(file_1).open("r") as f1, AnyPath(file_2).open("r") as f2:
-        assert files.hash_file_content(f1.read()) == files.hash_file_content(f2.read())
+    file_1 = AnyPath(file_1)
+    file_2 = AnyPath(file_2)
+
+    # Files of different sizes cannot be equal, no need to read them
+    size_1 = file_1.stat().st_size
+    size_2 = file_2.stat().st_size
+    assert size_1 == size_2, (
+        f"Non equal file sizes!\n{file_1}: {size_1} != {file_2}: {size_2}"
+    )
+
+    if path.is_cloud_path(file_1) or path.is_cloud_path(file_2):
+        # Hash both files concurrently to overlap their downloads/reads (hashlib releases the GIL)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            hash_1, hash_2 = executor.map(_hash_file, (file_1, file_2))
+        assert hash_1 == hash_2, f"{file_1} != {file_2}"
+    else:
+        assert filecmp.cmp(file_1, file_2, shallow=False), f"{file_1} != {file_2}"
 
 
 def assert_meta(meta_1: dict, meta_2: dict, tf_precision: float = 1e-9):
@@ -189,12 +274,30 @@ def assert_raster_equal(path_1: AnyPathStrType, path_2: AnyPathStrType) -> None:
             "Please install 'rasterio' to use assert_raster_equal."
         ) from ex
 
+    # Byte-identical files are equal rasters: no need to decode them
+    if _are_identical_local_files(path_1, path_2):
+        return
+
     with rasterio.open(str(path_1)) as ds_1, rasterio.open(str(path_2)) as ds_2:
         # Metadata
         assert_meta(ds_1.meta, ds_2.meta)
 
-        # Assert equal
-        np.testing.assert_array_equal(ds_1.read(), ds_2.read())
+        # Assert equal, block by block to limit the memory footprint and to stop at the first mismatch
+        is_float = np.issubdtype(ds_1.dtypes[0], np.floating)
+        for _, window in ds_1.block_windows(1):
+            arr_1 = ds_1.read(window=window)
+            arr_2 = ds_2.read(window=window)
+
+            # Same dtype and shape (checked in the metadata): identical memory means identical arrays (memcmp)
+            if arr_1.tobytes() == arr_2.tobytes():
+                continue
+
+            # Floats can be equal with different bytes (NaN payloads, signed zeros)
+            if not (is_float and np.array_equal(arr_1, arr_2, equal_nan=True)):
+                # Let numpy build the mismatch report
+                np.testing.assert_array_equal(
+                    arr_1, arr_2, err_msg=f"Mismatch in window {window}"
+                )
 
 
 def assert_raster_almost_equal(
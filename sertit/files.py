@@ -15,25 +15,30 @@
 # limitations under the License.
 """Tools for paths and files"""
 
+import contextlib
+import fnmatch
 import hashlib
 import json
 import logging
 import os
+import pickle
 import re
 import shutil
+import sys
 import tarfile
 import tempfile
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime
 from enum import Enum
+from functools import lru_cache
 from json import JSONDecoder, JSONEncoder
 from pathlib import Path
 from typing import Any, Union
 
-import dill
 import numpy as np
+from cloudpathlib import S3Path
 from lxml import etree, html
-from tqdm import tqdm
 
 from sertit import AnyPath, logs, path
 from sertit.logs import SU_NAME
@@ -42,6 +47,43 @@ from sertit.types import AnyPathStrType, AnyPathType
 
 LOGGER = logging.getLogger(SU_NAME)
 
+EXTRACT_BUFFER_SIZE = 2 * 1024 * 1024
+""" Size of the buffer used to copy the files extracted from tar archives (2 MiB instead of the default 16 KiB) """
+
+ZIP_PARALLEL_MIN_SIZE = 1024 * 1024
+""" Minimum mean compressed size of the members of a zip file to extract them in parallel (1 MiB) """
+
+HASH_BUFFER_SIZE = 1024 * 1024
+""" Size of the buffer used to read the files hashed by :code:`hash_file` (1 MiB) """
+
+COPY_BLOCK_SIZE = 8 * 1024 * 1024
+""" Minimum number of bytes asked to :code:`os.copy_file_range` at once when copying files (8 MiB) """
+
+
+_WARNED_MOVED_TO_PATH = set()
+""" Call sites of the functions moved to :py:mod:`sertit.path` that have already raised their deprecation warning """
+
+
+def _moved_to_path_warning(function_name: str) -> None:
+    """
+    Raise the deprecation warning of a function moved to :py:mod:`sertit.path`, only once per call site.
+
+    These pass-through functions can be called in loops: the warning (and its stack walk) is only worth it once per line calling them.
+    Another call site still gets its own warning (i.e. if the warning has been filtered out when a library called the function).
+
+    Args:
+        function_name (str): Name of the deprecated function
+    """
+    # 0: this function, 1: the deprecated function, 2: its caller
+    caller = sys._getframe(2)
+    call_site = (function_name, caller.f_code, caller.f_lineno)
+    if call_site not in _WARNED_MOVED_TO_PATH:
+        _WARNED_MOVED_TO_PATH.add(call_site)
+        logs.deprecation_warning(
+            "This function is deprecated. Import it from 'sertit.path' instead of 'sertit.files'",
+            stacklevel=4,
+        )
+
 
 def get_root_path() -> AnyPathType:
     """
@@ -58,9 +100,7 @@ def get_root_path() -> AnyPathType:
         "/" on Linux
         "C:/" on Windows (if you run this code from the C: drive)
     """
-    logs.deprecation_warning(
-        "This function is deprecated. Import it from 'sertit.path' instead of 'sertit.files'"
-    )
+    _moved_to_path_warning("get_root_path")
     return path.get_root_path()
 
 
@@ -92,9 +132,7 @@ def listdir_abspath(directory: AnyPathStrType) -> list:
         'D:/_SERTIT_UTILS/sertit-utils/sertit/version.py',
         'D:/_SERTIT_UTILS/sertit-utils/sertit/__init__.py']
     """
-    logs.deprecation_warning(
-        "This function is deprecated. Import it from 'sertit.path' instead of 'sertit.files'"
-    )
+    _moved_to_path_warning("listdir_abspath")
     return path.listdir_abspath(directory)
 
 
@@ -132,9 +170,7 @@ def to_abspath(
         >>>     type=to_abspath
         >>> )
     """
-    logs.deprecation_warning(
-        "This function is deprecated. Import it from 'sertit.path' instead of 'sertit.files'"
-    )
+    _moved_to_path_warning("to_abspath")
     return path.to_abspath(raw_path, create, raise_file_not_found)
 
 
@@ -159,12 +195,65 @@ def real_rel_path(raw_path: AnyPathStrType, start: AnyPathStrType) -> AnyPathTyp
         >>> real_rel_path(path, start)
         'sertit-utils/sertit'
     """
-    logs.deprecation_warning(
-        "This function is deprecated. Import it from 'sertit.path' instead of 'sertit.files'"
-    )
+    _moved_to_path_warning("real_rel_path")
     return path.real_rel_path(raw_path, start)
 
 
+def _extract_zip(zip_file: zipfile.ZipFile, output: AnyPathStrType) -> None:
+    """
+    Extract all the members of a zip file, in parallel if it is worth it.
+
+    Decompression releases the GIL, so big members are extracted in parallel threads (up to the number of CPUs).
+    The threads share the opened :code:`ZipFile` (and its already parsed central directory):
+    only the reads of the compressed data are serialized, the decompression and the writes are concurrent.
+
+    With a single CPU or with small members, the members are extracted serially.
+
+    Args:
+        zip_file (zipfile.ZipFile): Opened zip file
+        output (AnyPathStrType): Output directory
+    """
+    members = zip_file.infolist()
+    nof_workers = min(os.cpu_count() or 1, len(members))
+    mean_size = sum(member.compress_size for member in members) / max(len(members), 1)
+    if nof_workers <= 1 or mean_size < ZIP_PARALLEL_MIN_SIZE:
+        zip_file.extractall(output)
+        return
+
+    def extract_member(member):
+        try:
+            zip_file.extract(member, output)
+        except FileExistsError:
+            # The parent directory has been created concurrently by another thread
+            zip_file.extract(member, output)
+
+    with ThreadPoolExecutor(max_workers=nof_workers) as executor:
+        # Consume the results to raise the exceptions
+        list(executor.map(extract_member, members))
+
+
+def _open_archive_stream(file_path: AnyPathType):
+    """
+    Open an archive as a binary stream, to be read sequentially.
+
+    Archives stored on S3 are streamed directly from the bucket, without being cached on disk first.
+
+    Args:
+        file_path (AnyPathType): Archive file path
+
+    Returns:
+        Binary stream of the archive
+    """
+    if isinstance(file_path, S3Path):
+        return file_path.client.client.get_object(
+            Bucket=file_path.bucket,
+            Key=file_path.key,
+            **file_path.client.boto3_dl_extra_args,
+        )["Body"]
+    else:
+        return open(file_path, "rb")
+
+
 def extract_file(
     file_path: AnyPathStrType,
     output: AnyPathStrType,
@@ -207,31 +296,58 @@ def extract_file(
         )
         return archive_output
 
-    def extract_sub_dir(arch, filename_list):
+    def extract_sub_dir(extract_all, filename_list):
         top_level_files = list({item.split("/")[0] for item in filename_list})
 
         # When the only root directory in the archive has the right name, we don't have to create it
         if len(top_level_files) == 1 and archive_output.name == path.get_filename(
             top_level_files[0]
         ):
-            arch.extractall(archive_output.parent)
+            extract_all(archive_output.parent)
             archive_output.parent.joinpath(top_level_files[0]).rename(archive_output)
         else:
-            arch.extractall(archive_output)
+            extract_all(archive_output)
 
     # Manage archive type
+    is_tar = file_path.suffix == ".tar" or file_path.suffixes == [".tar", ".gz"]
     if file_path.suffix == ".zip":
         with zipfile.ZipFile(file_path, "r") as zip_file:
-            extract_sub_dir(zip_file, zip_file.namelist())
-    elif file_path.suffix == ".tar" or file_path.suffixes == [".tar", ".gz"]:
-        with tarfile.open(file_path, "r") as tar_file:
-            extract_sub_dir(tar_file, tar_file.getnames())
+            extract_sub_dir(
+                lambda arch_output: _extract_zip(zip_file, arch_output),
+                zip_file.namelist(),
+            )
+    elif is_tar and (isinstance(file_path, S3Path) or file_path.suffix == ".gz"):
+        # Read the archive in one pass:
+        # - stream the tar from S3: extract while downloading, without caching the archive on disk
+        # - don't decompress .tar.gz twice (listing the members, then seeking back to extract them)
+        # The members are only known once extracted, so extract them in a temporary directory first
+        output.mkdir(parents=True, exist_ok=True)
+        with tempfile.TemporaryDirectory(dir=output) as tmp_dir:
+            tar_stream = _open_archive_stream(file_path)
+            with (
+                contextlib.closing(tar_stream),
+                tarfile.open(
+                    fileobj=tar_stream, mode="r|*", copybufsize=EXTRACT_BUFFER_SIZE
+                ) as tar_file,
+            ):
+                tar_file.extractall(tmp_dir)
+
+            # Move (and not copy) the extracted files
+            extract_sub_dir(
+                lambda arch_output: shutil.copytree(
+                    tmp_dir, arch_output, copy_function=shutil.move, dirs_exist_ok=True
+                ),
+                os.listdir(tmp_dir),
+            )
+    elif is_tar:
+        with tarfile.open(file_path, "r", copybufsize=EXTRACT_BUFFER_SIZE) as tar_file:
+            extract_sub_dir(tar_file.extractall, tar_file.getnames())
     elif file_path.suffix == ".7z":
         try:
             import py7zr
 
             with py7zr.SevenZipFile(file_path, "r") as z7_file:
-                extract_sub_dir(z7_file, z7_file.getnames())
+                extract_sub_dir(z7_file.extractall, z7_file.getnames())
         except ModuleNotFoundError as exc:
             raise TypeError("Please install 'py7zr' to extract .7z files") from exc
     else:
@@ -262,6 +378,8 @@ def extract_files(
     Returns:
         list: Extracted files (even pre-existing ones)
     """
+    from tqdm import tqdm
+
     LOGGER.info("Extracting products in %s", output)
     progress_bar = tqdm(archives)
     extracts = []
@@ -290,9 +408,7 @@ def get_archived_file_list(archive_path: AnyPathStrType) -> list:
         >>> get_archived_file_list(arch_path, file_regex)
         ['file_1.txt', 'file_2.tif', 'file_3.xml', 'file_4.geojson']
     """
-    logs.deprecation_warning(
-        "This function is deprecated. Import it from 'sertit.path' instead of 'sertit.files'"
-    )
+    _moved_to_path_warning("get_archived_file_list")
     return path.get_archived_file_list(archive_path)
 
 
@@ -324,9 +440,7 @@ def get_archived_path(
     Returns:
         Union[list, str]: Path from inside the zipfile
     """
-    logs.deprecation_warning(
-        "This function is deprecated. Import it from 'sertit.path' instead of 'sertit.files'"
-    )
+    _moved_to_path_warning("get_archived_path")
     return path.get_archived_path(archive_path, file_regex, as_list)
 
 
@@ -370,12 +484,31 @@ def get_archived_rio_path(
         >>> rasterio.open(path)
         <open DatasetReader name='zip+file://D:/path/to/output.zip!dir/filename.tif' mode='r'>
     """
-    logs.deprecation_warning(
-        "This function is deprecated. Import it from 'sertit.path' instead of 'sertit.files'"
-    )
+    _moved_to_path_warning("get_archived_rio_path")
     return path.get_archived_rio_path(archive_path, file_regex, as_list)
 
 
+@lru_cache(maxsize=32)
+def _get_tar_members(
+    archive_path: AnyPathType, mtime: float, size: int
+) -> dict[str, tarfile.TarInfo]:
+    """
+    Get the members of a tar archive, by name.
+
+    The modification time and the size of the archive are only given to invalidate the cache when the archive changes.
+
+    Args:
+        archive_path (AnyPathType): Tar archive path
+        mtime (float): Modification time of the archive
+        size (int): Size of the archive
+
+    Returns:
+        dict[str, tarfile.TarInfo]: Members of the tar archive
+    """
+    with tarfile.open(archive_path) as tar_ds:
+        return {mb.name: mb for mb in tar_ds.getmembers()}
+
+
 def read_archived_file(
     archive_path: AnyPathStrType, regex: str, file_list: list = None
 ) -> bytes:
@@ -400,20 +533,24 @@ def read_archived_file(
     # Open tar and zip XML
     try:
         if archive_path.suffix == ".tar":
+            # Listing the members of a tar means reading all their headers: cache them
+            stat = archive_path.stat()
+            tar_members = _get_tar_members(archive_path, stat.st_mtime, stat.st_size)
+            if file_list is None:
+                file_list = tar_members
+            tarinfo = tar_members[next(filter(regex.match, file_list))]
+
             with tarfile.open(archive_path) as tar_ds:
-                # file_list is not very useful for TAR files...
-                if file_list is None:
-                    tar_mb = tar_ds.getmembers()
-                    file_list = [mb.name for mb in tar_mb]
-                name = list(filter(regex.match, file_list))[0]
-                tarinfo = tar_ds.getmember(name)
                 file_str = tar_ds.extractfile(tarinfo).read()
         elif archive_path.suffix == ".zip":
             with zipfile.ZipFile(archive_path) as zip_ds:
                 if file_list is None:
-                    file_list = [f.filename for f in zip_ds.filelist]
-                name = list(filter(regex.match, file_list))[0]
-                file_str = zip_ds.read(name)
+                    zipinfo = next(
+                        info for info in zip_ds.infolist() if regex.match(info.filename)
+                    )
+                else:
+                    zipinfo = next(filter(regex.match, file_list))
+                file_str = zip_ds.read(zipinfo)
 
         elif archive_path.suffix == ".tar.gz":
             raise TypeError(
@@ -423,7 +560,7 @@ def read_archived_file(
             raise TypeError(
                 "Only .zip and .tar files can be read from inside its archive."
             )
-    except IndexError as exc:
+    except StopIteration as exc:
         raise FileNotFoundError(
             f"Impossible to find file {regex} in {path.get_filename(archive_path)}"
         ) from exc
@@ -525,12 +662,20 @@ def archive(
     archive_base = os.path.splitext(archive_path)[0]
 
     # Archive the folder
-    archive_fn = shutil.make_archive(
-        archive_base,
-        format=fmt,
-        root_dir=folder_path.parent,
-        base_dir=folder_path.name,
-    )
+    if fmt == "gztar":
+        # shutil.make_archive compresses with the maximum level (9),
+        # gzip's default level (6) is faster for a similar size
+        archive_fn = f"{archive_base}.tar.gz"
+        os.makedirs(os.path.dirname(archive_fn) or os.curdir, exist_ok=True)
+        with tarfile.open(archive_fn, "w:gz", compresslevel=6) as tar_file:
+            tar_file.add(folder_path, arcname=folder_path.name)
+    else:
+        archive_fn = shutil.make_archive(
+            archive_base,
+            format=fmt,
+            root_dir=folder_path.parent,
+            base_dir=folder_path.name,
+        )
 
     if tmp_dir is not None:
         tmp_dir.cleanup()
@@ -538,6 +683,68 @@ def archive(
     return AnyPath(archive_fn)
 
 
+def _add_zip_to_zip(zip_file: zipfile.ZipFile, zip_to_add: str) -> None:
+    """
+    Add the content of a zip file into another (opened) zip file, in a directory named after the added zip file.
+
+    The entries are streamed from one zip to the other, without being extracted on disk.
+    The resulting tree is the same as with :py:func:`extract_file`.
+
+    Args:
+        zip_file (zipfile.ZipFile): Zip file opened in append mode
+        zip_to_add (str): Path of the zip file to add
+    """
+    root_name = path.get_filename(zip_to_add)
+
+    with zipfile.ZipFile(zip_to_add, "r") as zip_ds:
+        members = zip_ds.infolist()
+        top_level_files = {member.filename.split("/")[0] for member in members}
+
+        # Same as extract_file: when the only root directory in the archive has the right name, don't create another one
+        keep_root = len(top_level_files) == 1 and root_name == path.get_filename(
+            next(iter(top_level_files))
+        )
+
+        def get_arcname(name: str) -> str:
+            if keep_root:
+                return "/".join([root_name] + name.split("/", 1)[1:])
+            else:
+                return f"{root_name}/{name}"
+
+        # Write the directories (in namelist at least)
+        dirs = {root_name}
+        for member in members:
+            arcname_parts = get_arcname(member.filename).rstrip("/").split("/")
+            dirs.update(
+                "/".join(arcname_parts[:idx]) for idx in range(1, len(arcname_parts))
+            )
+            if member.is_dir():
+                dirs.add("/".join(arcname_parts))
+
+        for dir_name in sorted(dirs):
+            dir_info = zipfile.ZipInfo(f"{dir_name}/")
+            dir_info.external_attr = (
+                0o40775 << 16
+            ) | 0x10  # Unix and MS-DOS directory flags
+            zip_file.writestr(dir_info, b"")
+
+        # Write files
+        for member in members:
+            if member.is_dir():
+                continue
+
+            zinfo = zipfile.ZipInfo(get_arcname(member.filename), member.date_time)
+            zinfo.external_attr = member.external_attr
+            zinfo.compress_type = zip_file.compression
+            # Known size: zipfile only writes ZIP64 headers for the members needing them
+            zinfo.file_size = member.file_size
+            with (
+                zip_ds.open(member, "r") as src,
+                zip_file.open(zinfo, "w") as dst,
+            ):
+                shutil.copyfileobj(src, dst, EXTRACT_BUFFER_SIZE)
+
+
 def add_to_zip(
     zip_path: AnyPathStrType,
     dirs_to_add: Union[list, AnyPathStrType],
@@ -574,6 +781,8 @@ def add_to_zip(
 
     # Add all folders to the existing zip
     # Forced to use ZipFile because make_archive only works with one folder and not existing zipfile
+    from tqdm import tqdm
+
     with zipfile.ZipFile(zip_path, "a") as zip_file:
         progress_bar = tqdm(dirs_to_add)
         for dir_to_add_path in progress_bar:
@@ -588,23 +797,25 @@ def add_to_zip(
             progress_bar.set_description(
                 f"Adding {os.path.basename(dir_to_add)} to {os.path.basename(zip_path)}"
             )
+            # Zip files are copied entry by entry, without being extracted on disk
+            if os.path.isfile(dir_to_add) and dir_to_add.endswith(".zip"):
+                _add_zip_to_zip(zip_file, dir_to_add)
+                continue
+
             tmp = tempfile.TemporaryDirectory()
             if os.path.isfile(dir_to_add):
                 dir_to_add = extract_file(dir_to_add, tmp.name)
 
+            base_path = os.path.join(dir_to_add, "..")
             for root, _, files in os.walk(dir_to_add):
-                base_path = os.path.join(dir_to_add, "..")
-
                 # Write dir (in namelist at least)
-                zip_file.write(root, os.path.relpath(root, base_path))
+                root_arcname = os.path.relpath(root, base_path)
+                zip_file.write(root, root_arcname)
 
-                # Write files
+                # Write files (relative path of the root directory computed only once)
                 for file in files:
                     zip_file.write(
-                        os.path.join(root, file),
-                        os.path.relpath(
-                            os.path.join(root, file), os.path.join(dir_to_add, "..")
-                        ),
+                        os.path.join(root, file), os.path.join(root_arcname, file)
                     )
 
             # Clean tmp
@@ -632,9 +843,7 @@ def get_filename(file_path: AnyPathStrType, other_exts: Union[list, str] = None)
         >>> get_file_name(file_path)
         'filename'
     """
-    logs.deprecation_warning(
-        "This function is deprecated. Import it from 'sertit.path' instead of 'sertit.files'"
-    )
+    _moved_to_path_warning("get_filename")
     return path.get_filename(file_path, other_exts)
 
 
@@ -659,9 +868,7 @@ def get_ext(file_path: AnyPathStrType) -> str:
         >>> get_ext(file_path)
         'zip'
     """
-    logs.deprecation_warning(
-        "This function is deprecated. Import it from 'sertit.path' instead of 'sertit.files'"
-    )
+    _moved_to_path_warning("get_ext")
     return path.get_ext(file_path)
 
 
@@ -724,9 +931,77 @@ def remove_by_pattern(
     if extension and not extension.startswith("."):
         extension = "." + extension
 
-    file_list = directory.glob(name_with_wildcard + extension)
-    for file in file_list:
-        remove(file)
+    pattern = name_with_wildcard + (extension if extension else "")
+
+    # Cloud directories and patterns with subdirectories: use glob
+    if path.is_cloud_path(directory) or "/" in pattern or os.sep in pattern:
+        for file in directory.glob(pattern):
+            remove(file)
+        return
+
+    # Local directories: the type of the entries is already known while scanning (no additional stat)
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if fnmatch.fnmatch(entry.name, pattern):
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        shutil.rmtree(entry.path)
+                    elif entry.is_file():
+                        # Follow the symlinks, as remove does: links to files are removed,
+                        # links to directories and broken links are kept
+                        os.unlink(entry.path)
+                    else:
+                        LOGGER.debug("Impossible to remove %s", entry.path)
+                except OSError:
+                    LOGGER.debug("Impossible to remove %s", entry.path, exc_info=True)
+
+
+def _copy_file(src: str, dst: str) -> str:
+    """
+    Copy a file with its metadata, as :code:`shutil.copy2`, but with :code:`os.copy_file_range` when available (Linux).
+
+    The data doesn't go through the user space and is only referenced (reflink) on copy-on-write filesystems (i.e. btrfs, XFS).
+    Falls back to :code:`shutil.copy2` when :code:`copy_file_range` is not supported or doesn't copy the whole file.
+
+    Args:
+        src (str): Source file
+        dst (str): Destination (file or folder)
+
+    Returns:
+        str: Destination file
+    """
+    # shutil already uses copy_file_range from Python 3.14
+    if not hasattr(os, "copy_file_range") or sys.version_info >= (3, 14):
+        return shutil.copy2(src, dst)
+
+    if os.path.isdir(dst):
+        dst = os.path.join(dst, os.path.basename(src))
+
+    # Don't truncate the source file
+    if os.path.exists(dst) and os.path.samefile(src, dst):
+        raise shutil.SameFileError(f"{src} and {dst} are the same file")
+
+    try:
+        with open(src, "rb") as src_file, open(dst, "wb") as dst_file:
+            size = os.fstat(src_file.fileno()).st_size
+            block_size = max(size, COPY_BLOCK_SIZE)
+            copied = 0
+
+            # Copy until EOF instead of trusting the size (i.e. files from /proc have a size of 0)
+            while nof_bytes := os.copy_file_range(
+                src_file.fileno(), dst_file.fileno(), block_size
+            ):
+                copied += nof_bytes
+    except OSError:
+        # e.g. cross-device copies with old kernels or unsupported filesystems
+        return shutil.copy2(src, dst)
+
+    # copy_file_range can silently copy nothing on some filesystems (the same guard exists in shutil)
+    if copied == 0 or copied < size:
+        return shutil.copy2(src, dst)
+
+    shutil.copystat(src, dst)
+    return dst
 
 
 def copy(src: AnyPathStrType, dst: AnyPathStrType) -> AnyPathType:
@@ -759,9 +1034,9 @@ def copy(src: AnyPathStrType, dst: AnyPathStrType) -> AnyPathType:
         out = None
         try:
             if src.is_dir():
-                out = AnyPath(shutil.copytree(src, dst))
+                out = AnyPath(shutil.copytree(src, dst, copy_function=_copy_file))
             elif os.path.isfile(src):
-                out = AnyPath(shutil.copy2(src, dst))
+                out = AnyPath(_copy_file(src, dst))
         except shutil.Error:
             LOGGER.debug("Error in copy!", exc_info=True)
             out = src
@@ -814,13 +1089,15 @@ def find_files(
         >>> find_files("huhu.txt", root_path, max_nof_files=1, get_as_str=True)
         found = 'D:/root/dir1/huhu.txt'
     """
-    logs.deprecation_warning(
-        "This function is deprecated. Import it from 'sertit.path' instead of 'sertit.files'"
-    )
+    _moved_to_path_warning("find_files")
     return path.find_files(names, root_paths, max_nof_files, get_as_str)
 
 
 # subclass JSONDecoder
+_DATE_PREFIX = re.compile(r"\d{4}-\d{1,2}-")
+""" Prefix of all the strings that can be parsed as dates by :py:class:`CustomDecoder` ("%Y-%m-" as understood by strptime) """
+
+
 class CustomDecoder(JSONDecoder):
     """Decoder for JSON with methods for datetimes"""
 
@@ -839,7 +1116,8 @@ class CustomDecoder(JSONDecoder):
             dict: Dict with decoded object
         """
         for key, val in obj.items():
-            if isinstance(val, str):
+            # Only try to parse the strings that can be dates, parsing failures (exceptions) are costly
+            if isinstance(val, str) and _DATE_PREFIX.match(val):
                 try:
                     # Datetime -> Encoder saves dates as isoformat: "%Y-%m-%dT%H:%M:%S" (DATE_FORMAT)
                     # Isoformat in Python 3.11 has been extended and has too many ways of reading datetimes
@@ -855,23 +1133,24 @@ class CustomDecoder(JSONDecoder):
                             # Date -> Encoder saves date as isoformat: %Y-%m-%d
                             obj[key] = datetime.strptime(val, "%Y-%m-%d").date()
                     except ValueError:
-                        obj[key] = val
-            else:
-                obj[key] = val
+                        pass
         return obj
 
 
 # subclass JSONEncoder
 class CustomEncoder(JSONEncoder):
-    """Encoder for JSON with methods for datetimes and np.int64"""
+    """Encoder for JSON with methods for datetimes, numpy types and Enums"""
 
     # pylint: disable=W0221
     def default(self, obj):
         """Overload of the default method"""
         if isinstance(obj, (date, datetime)):
             out = obj.isoformat()
-        elif isinstance(obj, (np.int64, np.int32)):
-            out = int(obj)
+        elif isinstance(obj, np.generic):
+            # Any numpy scalar (integers, floats, booleans...) -> closest Python type
+            out = obj.item()
+        elif isinstance(obj, np.ndarray):
+            out = obj.tolist()
         elif isinstance(obj, Enum):
             out = obj.value
         elif isinstance(obj, set | Path) or path.is_cloud_path(obj):
@@ -901,7 +1180,9 @@ def read_json(json_file: AnyPathStrType, print_file: bool = True) -> dict:
 
     with open(json_file) as file:
         data = json.load(file, cls=CustomDecoder)
-        if print_file:
+
+        # Don't serialize the data only to throw it away
+        if print_file and LOGGER.isEnabledFor(logging.DEBUG):
             LOGGER.debug(
                 "Configuration file %s contains:\n%s",
                 json_file,
@@ -939,17 +1220,29 @@ def save_json(json_dict: dict, output_json: AnyPathStrType, **kwargs) -> None:
     kwargs["indent"] = kwargs.get("indent", 3)
     kwargs["cls"] = kwargs.get("cls", CustomEncoder)
 
+    # Serialize in memory and write once: json.dump streams many small chunks
+    # and never uses the C encoder, whereas json.dumps does when indent is None
+    json_str = json.dumps(json_dict, **kwargs)
     with open(output_json, "w") as output_file:
-        json.dump(json_dict, output_file, **kwargs)
+        output_file.write(json_str)
 
 
-def save_obj(obj: Any, path: AnyPathStrType, **kwargs) -> None:
+def save_obj(obj: Any, path: AnyPathStrType, use_dill: bool = True, **kwargs) -> None:
     """
+    .. versionchanged:: 1.47.0
+       Pickle with the highest protocol available by default. Add the :code:`use_dill` argument.
+
     Save an object as a pickle (can save any Python objects).
 
+    Set :code:`use_dill=False` to use the standard (and much faster) :code:`pickle` module
+    when the object doesn't need :code:`dill` (i.e. no lambdas, nested functions, interactively defined classes...).
+    The pickles are loadable with :code:`load_obj` in both cases.
+
     Args:
         obj (Any): Any object serializable
         path (AnyPathStrType): Path where to write the pickle
+        use_dill (bool): Use :code:`dill` (able to pickle more objects) instead of :code:`pickle` (faster)
+        **kwargs: Other arguments passed to :code:`dump` (i.e. :code:`protocol`)
 
     Example:
         >>> output_pkl = 'D:/path/to/pickle.pkl'
@@ -958,8 +1251,14 @@ def save_obj(obj: Any, path: AnyPathStrType, **kwargs) -> None:
                         "C": SomeEnum.some_name}
         >>> save_json(output_pkl, pkl_dict)
     """
-    with open(path, "wb+") as file:
-        dill.dump(obj, file, **kwargs)
+    if use_dill:
+        import dill as pickler
+    else:
+        import pickle as pickler
+
+    kwargs.setdefault("protocol", pickle.HIGHEST_PROTOCOL)
+    with open(path, "wb") as file:
+        pickler.dump(obj, file, **kwargs)
 
 
 def load_obj(path: AnyPathStrType) -> Any:
@@ -978,6 +1277,8 @@ def load_obj(path: AnyPathStrType) -> Any:
         {"A": np.ones([3, 3]), "B": datetime.today(), "C": SomeEnum.some_name}
 
     """
+    import dill
+
     with open(path, "rb") as file:
         return dill.load(file)
 
@@ -1034,22 +1335,25 @@ def get_file_in_dir(
         >>> get_file_in_dir(directory, "huhu", get_list=True, exact_name=True)
         []
     """
-    logs.deprecation_warning(
-        "This function is deprecated. Import it from 'sertit.path' instead of 'sertit.files'"
-    )
+    _moved_to_path_warning("get_file_in_dir")
     return path.get_file_in_dir(
         directory, pattern_str, extension, filename_only, get_list, exact_name
     )
 
 
 # pylint: disable=E1121
-def hash_file_content(file_content: str, len_param: int = 5) -> str:
+def hash_file_content(file_content: Union[str, bytes], len_param: int = 5) -> str:
     """
+    .. versionchanged:: 1.47.0
+       Hash with BLAKE2b instead of SHAKE-256 (faster): the hashes are different from the previous versions.
+
     Hash a file into a unique str.
 
+    The whole content needs to be in memory: use :py:func:`hash_file` to hash big files directly from the disk.
+
     Args:
-        file_content (str): File content
-        len_param (int): Length parameter for the hash (length of the key will be 2x this number)
+        file_content (Union[str, bytes]): File content
+        len_param (int): Length parameter for the hash (length of the key will be 2x this number, up to 64)
 
     Returns:
         str: Hashed file content
@@ -1061,9 +1365,70 @@ def hash_file_content(file_content: str, len_param: int = 5) -> str:
         >>> hash_file_content(str(file_content))
         "d3fad5bdf9"
     """
-    hasher = hashlib.shake_256()
-    hasher.update(str.encode(file_content))
-    return hasher.hexdigest(len_param)
+    if isinstance(file_content, str):
+        file_content = file_content.encode()
+
+    return hashlib.blake2b(file_content, digest_size=len_param).hexdigest()
+
+
+def hash_file(file_path: AnyPathStrType, len_param: int = 5) -> str:
+    """
+    Hash a file into a unique str, without reading it entirely in memory.
+
+    The file is read by chunks into a reusable buffer. The result is the same as :py:func:`hash_file_content` with the file's binary content.
+
+    Args:
+        file_path (AnyPathStrType): Path to the file to hash
+        len_param (int): Length parameter for the hash (length of the key will be 2x this number, up to 64)
+
+    Returns:
+        str: Hashed file
+
+    Example:
+        >>> hash_file("path/to/json.json")
+        "1fe5bd5c00"
+    """
+    hasher = hashlib.blake2b(digest_size=len_param)
+    buffer = bytearray(HASH_BUFFER_SIZE)
+    view = memoryview(buffer)
+    with AnyPath(file_path).open("rb") as file:
+        while nof_bytes := file.readinto(buffer):
+            hasher.update(view[:nof_bytes])
+
+    return hasher.hexdigest()
+
+
+def hash_file_contents(file_contents: list, len_param: int = 5) -> list:
+    """
+    Hash several files into unique strs, as :py:func:`hash_file_content` does for one file.
+
+    :code:`hashlib` releases the GIL while hashing, so big contents (more than 1 MB in total) are hashed in parallel threads.
+
+    Args:
+        file_contents (list): Contents of the files (str or bytes)
+        len_param (int): Length parameter for the hashes (length of the keys will be 2x this number, up to 64)
+
+    Returns:
+        list: Hashed file contents, in the same order
+
+    Example:
+        >>> hash_file_contents([str(file_content_1), str(file_content_2)])
+        ["d3fad5bdf9", "1fe5bd5c00"]
+    """
+    file_contents = [
+        content.encode() if isinstance(content, str) else content
+        for content in file_contents
+    ]
+
+    def hash_content(content):
+        return hash_file_content(content, len_param)
+
+    # Threads are only worth it for big contents
+    if len(file_contents) > 1 and sum(len(content) for content in file_contents) > 1e6:
+        with ThreadPoolExecutor() as executor:
+            return list(executor.map(hash_content, file_contents))
+    else:
+        return [hash_content(content) for content in file_contents]
 
 
 def is_writable(dir_path: AnyPathStrType):
@@ -1079,7 +1444,5 @@ def is_writable(dir_path: AnyPathStrType):
     Returns:
         bool: True if the directory is writable
     """
-    logs.deprecation_warning(
-        "This function is deprecated. Import it from 'sertit.path' instead of 'sertit.files'"
-    )
+    _moved_to_path_warning("is_writable")
     return path.is_writable(dir_path)
@@ -51,10 +51,8 @@ def from_polygon_to_bounds(polygon: AnyPolygonType) -> (float, float, float, flo
         >>> from_polygon_to_bounds(poly)
         (0.0, 0.0, 1.0, 1.0)
     """
-    left = polygon.bounds[0]  # xmin
-    bottom = polygon.bounds[1]  # ymin
-    right = polygon.bounds[2]  # xmax
-    top = polygon.bounds[3]  # ymax
+    # Compute the bounds only once
+    left, bottom, right, top = polygon.bounds
 
     assert left < right
     assert bottom < top
@@ -116,7 +114,7 @@ def get_wider_exterior(vector: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
 
     # Only select the exterior of this footprint(sometimes some holes persist)
     if not wider.empty:
-        poly = Polygon(list(wider.exterior.iat[0].coords))
+        poly = Polygon(wider.exterior.iat[0])
         wider = gpd.GeoDataFrame(geometry=[poly], crs=wider.crs)
 
         # Resets index as we only got one polygon left which should have index 0
@@ -151,28 +149,18 @@ def make_valid(gdf: gpd.GeoDataFrame, verbose=False) -> gpd.GeoDataFrame:
                                                            geometry
         1         MULTIPOLYGON (((491314.496 5616444.620, 491295...
     """
-    try:
-        geos_logger = logging.getLogger("shapely.geos")
-        previous_level = geos_logger.level
-        if verbose:
-            logging.debug(f"Invalid geometries:\n\t{gdf[~gdf.is_valid]}")
-        else:
-            geos_logger.setLevel(logging.CRITICAL)
-
-        # Discard self-intersection and null geometries
-        from shapely.validation import make_valid
+    geos_logger = logging.getLogger("shapely.geos")
+    previous_level = geos_logger.level
+    if verbose:
+        logging.debug(f"Invalid geometries:\n\t{gdf[~gdf.is_valid]}")
+    else:
+        geos_logger.setLevel(logging.CRITICAL)
 
-        gdf.geometry = gdf.geometry.apply(make_valid)
+    # Discard self-intersection and null geometries (vectorized over the whole GeoSeries)
+    gdf.geometry = gdf.geometry.make_valid()
 
-        if not verbose:
-            geos_logger.setLevel(previous_level)
-    except ImportError:
-        import shapely
-
-        LOGGER.warning(
-            f"'make_valid' not available in 'shapely' (version {shapely.__version__} < 1.8). "
-            f"The obtained vector may be broken !"
-        )
+    if not verbose:
+        geos_logger.setLevel(previous_level)
 
     return gdf
 
@@ -211,33 +199,34 @@ def simplify_footprint(
     # Number of pixels of tolerance
     tolerance = [1, 2, 4, 8, 16, 32, 64, 128, 256]
 
-    # Process only if given footprint is too complex (too many vertices)
-    def simplify_geom(value):
-        nof_vertices = len(value.exterior.coords)
-        if nof_vertices > max_nof_vertices:
-            for tol in tolerance:
-                # Simplify footprint
-                value = value.simplify(
-                    tolerance=tol * resolution, preserve_topology=True
-                )
+    def nof_exterior_vertices(geoms: np.ndarray) -> np.ndarray:
+        return shapely.get_num_points(shapely.get_exterior_ring(geoms))
 
-                # Check if OK
-                nof_vertices = len(value.exterior.coords)
-                if nof_vertices <= max_nof_vertices:
-                    break
-
-        # WARNING if nof_vertices > max_nof_vertices
-        nof_vertices = len(value.exterior.coords)
-        if nof_vertices > max_nof_vertices:
-            LOGGER.warning(
-                f"The number of vertices ({nof_vertices}) of your simplified footprint is higher than {max_nof_vertices}."
-                f"However, it cannot be simplified further according to the given resolution ({resolution})."
-            )
+    footprint = footprint.explode(index_parts=True)
 
-        return value
+    # Simplify all the polygons at once (in GEOS), only the too complex ones (too many vertices) being processed
+    geoms = footprint.geometry.to_numpy()
+    too_complex = nof_exterior_vertices(geoms) > max_nof_vertices
+    for tol in tolerance:
+        if not too_complex.any():
+            break
 
-    footprint = footprint.explode(index_parts=True)
-    footprint.geometry = footprint.geometry.apply(simplify_geom)
+        # Simplify footprint
+        geoms[too_complex] = shapely.simplify(
+            geoms[too_complex], tolerance=tol * resolution, preserve_topology=True
+        )
+
+        # Check if OK
+        too_complex = nof_exterior_vertices(geoms) > max_nof_vertices
+
+    # WARNING if nof_vertices > max_nof_vertices
+    for nof_vertices in nof_exterior_vertices(geoms[too_complex]):
+        LOGGER.warning(
+            f"The number of vertices ({nof_vertices}) of your simplified footprint is higher than {max_nof_vertices}."
+            f"However, it cannot be simplified further according to the given resolution ({resolution})."
+        )
+
+    footprint.geometry = gpd.GeoSeries(geoms, index=footprint.index, crs=footprint.crs)
 
     return footprint
 
@@ -276,12 +265,10 @@ def fill_polygon_holes(
         """
         if threshold is not None:
             if threshold > 0 and len(polygon.interiors) > 0:
-                new_interiors = list(polygon.interiors)
-                for interior in polygon.interiors:
-                    interior_poly = Polygon(np.array(interior.coords))
-                    if interior_poly.area < threshold:
-                        new_interiors.remove(interior)
-                return Polygon(polygon.exterior, new_interiors)
+                # Compute the area of all the holes at once
+                interiors = np.array(polygon.interiors, dtype=object)
+                areas = shapely.area(shapely.polygons(interiors))
+                return Polygon(polygon.exterior, list(interiors[areas >= threshold]))
             else:
                 return polygon
         else:
@@ -18,12 +18,43 @@
 import logging
 import logging.config
 import os
-from datetime import datetime
+import sys
+import time
 from typing import Union
 
 LOGGING_FORMAT = "%(asctime)s - [%(levelname)s] - %(message)s"
 SU_NAME = "sertit"
 
+BASIC_FORMATTER_CONFIG = {
+    "format": LOGGING_FORMAT,
+}
+""" Configuration of the basic formatter used by :code:`create_logger` (for file logs or if :code:`colorlog` is not installed) """
+
+COLOR_FORMATTER_CONFIG = {
+    "()": "colorlog.ColoredFormatter",
+    "format": "%(asctime)s - [%(log_color)s%(levelname)s%(reset)s] - %(message_log_color)s%(message)s",
+    "datefmt": "%Y-%m-%d %H:%M:%S",
+    "reset": True,
+    "log_colors": {
+        "DEBUG": "white",
+        "INFO": "green",
+        "WARNING": "cyan",
+        "ERROR": "red",
+        "CRITICAL": "fg_bold_red,bg_white",
+    },
+    "secondary_log_colors": {
+        "message": {
+            "DEBUG": "white",
+            "INFO": "green",
+            "WARNING": "cyan",
+            "ERROR": "red",
+            "CRITICAL": "bold_red",
+        }
+    },
+    "style": "%",
+}
+""" Configuration of the colored formatter used by :code:`create_logger` for stream logs (if :code:`colorlog` is installed and the stream is a terminal) """
+
 
 def init_logger(
     curr_logger: logging.Logger,
@@ -86,10 +117,16 @@ def create_logger(
     other_loggers_stream_log_level: int = None,
 ) -> None:
     """
+    .. versionchanged:: 1.47.0
+       The stream logs are only colored if the stream is a terminal.
+       Set the :code:`FORCE_COLOR` environment variable to color them anyway (i.e. in Jupyter notebooks or GitLab job logs),
+       or :code:`NO_COLOR` to never color them.
+
     Create file and stream logger at the wanted level for the given logger.
 
-    - If you have :code:`colorlog` installed, it will produce colored logs.
+    - If you have :code:`colorlog` installed, it will produce colored logs (only if the stream is a terminal, unless :code:`FORCE_COLOR` is set)
     - If you do not give any output and name, it won't create any file logger
+    - The log file is only created when the first message is written into it
 
     It will also manage the log level of other specified logger that you give.
 
@@ -121,40 +158,28 @@ def create_logger(
     if other_loggers_stream_log_level is None:
         other_loggers_stream_log_level = stream_log_level
 
-    # Formatters
-    basic_fmter = {
-        "format": LOGGING_FORMAT,
-    }
-    try:
-        # 'colorlog.ColoredFormatter' imported but unused
-        from colorlog import ColoredFormatter  # noqa: F401
-
-        color_fmter = {
-            "()": "colorlog.ColoredFormatter",
-            "format": "%(asctime)s - [%(log_color)s%(levelname)s%(reset)s] - %(message_log_color)s%(message)s",
-            "datefmt": "%Y-%m-%d %H:%M:%S",
-            "reset": True,
-            "log_colors": {
-                "DEBUG": "white",
-                "INFO": "green",
-                "WARNING": "cyan",
-                "ERROR": "red",
-                "CRITICAL": "fg_bold_red,bg_white",
-            },
-            "secondary_log_colors": {
-                "message": {
-                    "DEBUG": "white",
-                    "INFO": "green",
-                    "WARNING": "cyan",
-                    "ERROR": "red",
-                    "CRITICAL": "bold_red",
-                }
-            },
-            "style": "%",
-        }
-    except ModuleNotFoundError:
-        logger.debug("Impossible to import colorlog, will log without colors.")
+    # Formatters (copied as dictConfig works on the given configuration)
+    basic_fmter = BASIC_FORMATTER_CONFIG.copy()
+    # No need for colors when the stream is redirected (i.e. to a file),
+    # unless forced with FORCE_COLOR (i.e. in Jupyter or GitLab job logs). NO_COLOR disables them, as in colorlog.
+    if "NO_COLOR" in os.environ:
+        use_colors = False
+    elif "FORCE_COLOR" in os.environ:
+        use_colors = True
+    else:
+        use_colors = sys.stderr is not None and sys.stderr.isatty()
+
+    if not use_colors:
         color_fmter = basic_fmter
+    else:
+        try:
+            # 'colorlog.ColoredFormatter' imported but unused
+            from colorlog import ColoredFormatter  # noqa: F401
+
+            color_fmter = COLOR_FORMATTER_CONFIG.copy()
+        except ModuleNotFoundError:
+            logger.debug("Impossible to import colorlog, will log without colors.")
+            color_fmter = basic_fmter
 
     # Initiate the logging configuration dictionary
     logging_dict = {
@@ -177,7 +202,7 @@ def create_logger(
 
     # Get logger file path
     if output_folder:
-        date = datetime.today().replace(microsecond=0).strftime("%y%m%d_%H%M%S")
+        date = time.strftime("%y%m%d_%H%M%S")
         log_file_name = f"{date}{f'_{name}' if name else ''}_log.txt"
         log_path = os.path.join(output_folder, log_file_name)
 
@@ -187,12 +212,14 @@ def create_logger(
                     "level": logging.getLevelName(file_log_level),
                     "class": "logging.FileHandler",
                     "filename": log_path,
+                    "delay": True,
                     "formatter": "basic_fmter",
                 },
                 "file_other": {
                     "level": logging.getLevelName(other_loggers_file_log_level),
                     "class": "logging.FileHandler",
                     "filename": log_path,
+                    "delay": True,
                     "formatter": "basic_fmter",
                 },
             }
@@ -264,32 +291,38 @@ def reset_logging() -> None:
     """
     manager = logging.root.manager
     manager.disabled = logging.NOTSET
+    # Handlers can be shared between loggers: keep them only once (in order)
+    handlers = {}
     for logger in manager.loggerDict.values():
         if isinstance(logger, logging.Logger):
             logger.setLevel(logging.NOTSET)
             logger.propagate = True
             logger.disabled = False
             logger.filters.clear()
-            handlers = logger.handlers.copy()
-            for handler in handlers:
-                # Copied from `logging.shutdown`.
-                try:
-                    handler.acquire()
-                    handler.flush()
-                    handler.close()
-                except (OSError, ValueError):
-                    pass
-                finally:
-                    handler.release()
-                logger.removeHandler(handler)
-
-
-def deprecation_warning(msg: str) -> None:
+
+            # Detach all the handlers at once instead of removing them one by one
+            handlers.update(dict.fromkeys(logger.handlers))
+            logger.handlers = []
+
+    for handler in handlers:
+        # Copied from `logging.shutdown`.
+        try:
+            handler.acquire()
+            handler.flush()
+            handler.close()
+        except (OSError, ValueError):
+            pass
+        finally:
+            handler.release()
+
+
+def deprecation_warning(msg: str, stacklevel: int = 3) -> None:
     """
     Create a depreciation warning.
 
     Args:
         msg (str): Deprecation warning
+        stacklevel (int): Stack level of the warning (by default, the caller of the deprecated function)
 
     Example:
         >>> def deprecated_fct():
@@ -301,4 +334,4 @@ def deprecation_warning(msg: str) -> None:
     """
     from warnings import warn
 
-    warn(msg, category=DeprecationWarning, stacklevel=3)  # Don't show this function
+    warn(msg, category=DeprecationWarning, stacklevel=stacklevel)
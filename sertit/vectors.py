@@ -176,7 +176,10 @@ def get_geodf(geom: Union[Polygon, list, gpd.GeoSeries], crs: str) -> gpd.GeoDat
     """
     if isinstance(geom, list):
         if isinstance(geom[0], Polygon):
-            pass
+            # Fill a presized object array to spare pandas the dtype inference
+            geom_arr = np.empty(len(geom), dtype=object)
+            geom_arr[:] = geom
+            geom = geom_arr
         else:
             try:
                 geom = [geometry.from_bounds_to_polygon(*geom)]